@@ -12,23 +12,39 @@ This Flask app demonstrates:
 """
 
 # Import Flask components for building web applications
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request
+# Response: Builds custom HTTP responses (used for JSON and for streaming CSV files)
 # render_template: Renders HTML templates
 # request: Handles incoming HTTP requests
-# jsonify: Converts Python data to JSON format
-# send_file: Sends files to the browser
 
 # Import CORS support to allow web pages to make requests from different domains
 from flask_cors import CORS
 
 # Import libraries for web scraping and data processing
-import requests          # For making HTTP requests to websites
-from bs4 import BeautifulSoup  # For parsing HTML content
+import asyncio          # For running many page downloads at the same time
+import atexit           # For closing the HTTP session when the app stops
+import aiohttp          # For making asynchronous HTTP requests to websites
+from lxml import etree, html as lxml_html  # For parsing HTML content quickly (written in C)
 import csv              # For creating CSV files
-import time             # For adding delays between requests
+import hashlib          # For building short fingerprints (ETags) of API responses
+from concurrent.futures import ProcessPoolExecutor  # For parsing pages on several CPU cores
+from collections import Counter, defaultdict  # For counting and grouping tags
 from datetime import datetime  # For working with dates and times
+from html import unescape  # For turning HTML entities like &amp; back into characters
 import io               # For working with in-memory file objects
+import multiprocessing  # For choosing how the parsing processes are started
+import re               # For regular expressions (fast text pattern matching)
+import orjson           # For converting Python data to JSON format (fast, written in Rust)
 import os               # For operating system functions
+import threading        # For running the scraper's event loop in the background
+
+# Brotli ("br") compression is optional: it is only requested from the website
+# when the brotli package is installed, because only then can responses be decoded
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
 
 # Create a new Flask application instance
 # __name__ is a special Python variable that tells Flask where to look for templates
@@ -38,6 +54,312 @@ app = Flask(__name__)
 # This allows web pages to make requests to your Flask app from different domains
 CORS(app)
 
+def ojson(payload, status=200):
+    """
+    Build a JSON response using orjson
+    
+    orjson is much faster than the standard json module that Flask's jsonify uses,
+    which matters when sending back hundreds of quotes at once
+    
+    Args:
+        payload: The Python data (dicts, lists, strings, numbers) to send
+        status (int): The HTTP status code (default: 200 OK)
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def conditional_ojson(etag, build_payload):
+    """
+    Build a JSON response that the browser can cache and revalidate
+    
+    If the browser already has the response with this ETag (it sends it back
+    in the If-None-Match header), we answer "304 Not Modified" with no body,
+    and the payload is never even built.
+    
+    Args:
+        etag (str): Fingerprint of the data the response would contain
+        build_payload (callable): Returns the Python data to send when needed
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = ojson(build_payload())
+    
+    response.set_etag(etag)
+    # "no-cache" means: keep a copy, but always ask us whether it is still valid
+    # (a new scrape can change the data at any moment)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+# The quote fields that are shown to users (in the JSON API and the CSV export)
+QUOTE_FIELDS = ['id', 'text', 'author', 'tags', 'page', 'timestamp']
+
+# Every column the scraper stores: the public fields plus helpers prepared at scrape time
+STORED_FIELDS = QUOTE_FIELDS + ['text_lower', 'author_lower', 'tags_set', 'tags_joined']
+
+# The stored columns written to each CSV row (in the same order as QUOTE_FIELDS)
+# The CSV "tags" column uses the tags already joined with semicolons
+CSV_COLUMNS = ['id', 'text', 'author', 'tags_joined', 'page', 'timestamp']
+
+def _has_class(name):
+    """
+    Build an XPath condition that is true when an element has the given CSS class
+    
+    XPath compares the whole class attribute, so class="quote big" would not
+    equal "quote" - padding it with spaces lets us look for one class name
+    """
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+# Precompiled XPath queries for finding the parts of a quote
+# Compiling them once up front means each page only has to run them
+XP_QUOTES = etree.XPath(f'//div[{_has_class("quote")}]')       # Every <div class="quote">
+XP_TEXT = etree.XPath(f'.//span[{_has_class("text")}]')         # The quote text inside one quote
+XP_AUTHOR = etree.XPath(f'.//small[{_has_class("author")}]')    # The author inside one quote
+XP_TAGS = etree.XPath(f'.//a[{_has_class("tag")}]')             # The tags inside one quote
+
+# quotes.toscrape.com writes every quote in exactly the same shape, so a
+# precompiled regular expression can pick out the parts straight from the raw
+# bytes - much faster than building an HTML tree. Groups: text, the HTML between
+# text and author, author, and the rest of the quote (which holds the tags)
+_QUOTE_RE = re.compile(
+    rb'<span class="text"[^>]*>(.*?)</span>(.*?)'
+    rb'<small class="author"[^>]*>(.*?)</small>(.*?)</div>\s*</div>',
+    re.DOTALL
+)
+_TAG_RE = re.compile(rb'<a class="tag"[^>]*>([^<]*)</a>')
+# The regular expression reads raw bytes, so it is only used on UTF-8 pages
+_UTF8_RE = re.compile(rb'<meta[^>]*charset=["\']?utf-8', re.IGNORECASE)
+
+def _element_text(element):
+    """
+    Get all the text inside an HTML element, with extra whitespace removed
+    """
+    return ''.join(element.itertext()).strip()
+
+def _quote_from_element(quote_element, quote_id, page_number, scraped_at):
+    """
+    Build the quote dictionary for one <div class="quote"> element
+    
+    Returns:
+        dict: The quote data, or None if the quote has no text or no author
+    """
+    # Extract the quote text
+    # Look for a <span> element with class="text" inside the quote div
+    text_elements = XP_TEXT(quote_element)
+    # Get the text content and remove extra whitespace
+    text = _element_text(text_elements[0]) if text_elements else ''
+    
+    # Extract the author name
+    # Look for a <small> element with class="author"
+    author_elements = XP_AUTHOR(quote_element)
+    author = _element_text(author_elements[0]) if author_elements else ''
+    
+    # Extract all the tags
+    # Look for all <a> elements with class="tag"
+    # Convert each tag to text and store in a list
+    tags = [_element_text(tag) for tag in XP_TAGS(quote_element)]
+    
+    return _make_quote(quote_id, text, author, tags, page_number, scraped_at)
+
+def _make_quote(quote_id, text, author, tags, page_number, scraped_at):
+    """
+    Build the quote dictionary from its already extracted parts
+    
+    Returns:
+        dict: The quote data, or None if the quote has no text or no author
+    """
+    # Only keep quotes that have both text and author
+    # This prevents empty or incomplete quotes from being added
+    if not (text and author):
+        return None
+    
+    # Create a dictionary with all the quote information
+    return {
+        'id': quote_id,               # Unique ID for each quote
+        'text': text,                 # The actual quote text
+        'author': author,             # Who said the quote
+        'tags': tags,                 # List of tags (not joined with semicolons)
+        'page': page_number,          # Which page this quote came from
+        'timestamp': scraped_at,      # When we scraped it
+        # Precomputed lookup helpers for fast filtering (not sent to the browser)
+        'text_lower': text.lower(),
+        'author_lower': author.lower(),
+        'tags_set': frozenset(tags),
+        'tags_joined': '; '.join(tags)  # Tags as one string, ready for the CSV export
+    }
+
+def _collect_quotes(quote_elements, page_number, start_id):
+    """
+    Turn the quote elements of one page into a list of quote dictionaries
+    
+    Args:
+        quote_elements: The <div class="quote"> elements (a list or a generator)
+        page_number (int): The page number the elements came from
+        start_id (int): The ID to give the first quote on this page
+    """
+    # All quotes on this page were scraped at the same moment,
+    # so read the clock once instead of once per quote
+    scraped_at = datetime.now().isoformat()
+    
+    # Create a list to store quotes from this specific page
+    page_quotes = []
+    
+    # The ID for the next quote we find - simply counts up from start_id
+    next_id = start_id
+    
+    # Loop through each quote element found on the page
+    for quote_element in quote_elements:
+        try:
+            quote_data = _quote_from_element(quote_element, next_id, page_number, scraped_at)
+            if quote_data:
+                # Add this quote to our page quotes list
+                page_quotes.append(quote_data)
+                next_id += 1
+        
+        except Exception as e:
+            # If there's an error parsing a specific quote, print the error
+            # and continue with the next quote instead of crashing
+            print(f"Error parsing quote: {e}")
+            continue
+    
+    # Return the quotes from this page
+    return page_quotes
+
+def _regex_quotes(html, page_number, start_id):
+    """
+    Extract quotes with regular expressions instead of an HTML parser
+    
+    Returns:
+        list: The quotes from this page, or None if the page doesn't have the
+        expected layout (the caller then falls back to the HTML parser)
+    """
+    if not _UTF8_RE.search(html, 0, 2048):
+        return None
+    
+    scraped_at = datetime.now().isoformat()
+    page_quotes = []
+    next_id = start_id
+    
+    try:
+        for match in _QUOTE_RE.finditer(html):
+            text_html, between, author_html, rest = match.groups()
+            
+            # Anything unexpected (nested tags, a match spanning two quotes)
+            # means the layout changed - let the HTML parser handle the page
+            # A quote without a tags <div> makes the end of the pattern run into
+            # the next quote, so the rest of the match is checked as well
+            if b'<' in text_html or b'<' in author_html or \
+               b'class="quote"' in between or b'class="quote"' in rest:
+                return None
+            
+            # Only the matched parts are decoded, not the whole page
+            text = unescape(text_html.decode('utf-8')).strip()
+            author = unescape(author_html.decode('utf-8')).strip()
+            tags = [unescape(tag.decode('utf-8')).strip() for tag in _TAG_RE.findall(rest)]
+            
+            quote_data = _make_quote(next_id, text, author, tags, page_number, scraped_at)
+            if quote_data:
+                page_quotes.append(quote_data)
+                next_id += 1
+    except UnicodeDecodeError:
+        return None
+    
+    # Nothing matched - maybe the layout changed, so let the HTML parser check
+    return page_quotes or None
+
+def _parse_quotes(html, page_number, start_id=1):
+    """
+    Extract quotes from the HTML of a single page
+    
+    This is a plain function (not a method) so it can be sent to another
+    process: the scraper parses pages in a process pool to use every CPU core.
+    
+    Args:
+        html (bytes): The raw HTML content of the page
+        page_number (int): The page number the HTML came from
+        start_id (int): The ID to give the first quote on this page
+        
+    Returns:
+        list: A list of dictionaries containing quote data from this page
+    """
+    try:
+        # Try the fast regular expression first
+        page_quotes = _regex_quotes(html, page_number, start_id)
+        if page_quotes is not None:
+            return page_quotes
+        
+        # Parse the HTML content of the webpage into a tree
+        # lxml is a fast parser written in C
+        tree = lxml_html.fromstring(html)
+        
+        # Find all HTML elements that contain quotes
+        # We're looking for <div> elements with class="quote"
+        return _collect_quotes(XP_QUOTES(tree), page_number, start_id)
+    
+    except Exception as e:
+        # Handle any errors that occur during parsing
+        print(f"Error parsing page {page_number}: {e}")
+        return []
+
+# A pool of worker processes for parsing HTML
+# Parsing is CPU work, so separate processes let several pages parse in parallel
+# The workers are started by a small "forkserver" process instead of forking the
+# app itself: the app runs several threads (gunicorn's threads and the scraper's
+# event loop), and a fork can copy a lock that another thread is holding,
+# leaving the new process stuck forever
+# Windows has no forkserver (it always starts fresh processes), so the default is used there
+if 'forkserver' in multiprocessing.get_all_start_methods():
+    _PARSE_CONTEXT = multiprocessing.get_context('forkserver')
+else:
+    _PARSE_CONTEXT = multiprocessing.get_context()
+_PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_PARSE_CONTEXT)
+
+class QuoteData:
+    """
+    One complete, read-only set of scraped quotes together with its indexes
+    
+    A new QuoteData is built after every scrape and then swapped in with a
+    single assignment. Requests running at the same time in other threads keep
+    using the set they started with, so they never see new columns mixed with
+    old indexes.
+    """
+    
+    def __init__(self, cols=None, last_scrape=None):
+        """
+        Build the indexes for a set of stored columns
+        
+        Args:
+            cols (dict): One list per field in STORED_FIELDS (default: no quotes)
+            last_scrape (str): When the scrape that produced the columns finished
+        """
+        # The scraped quotes are stored column by column: one list per field
+        # Row i of every list belongs to the same quote, so a search only has to
+        # read the columns it needs instead of every field of every quote
+        self.cols = cols or {field: [] for field in STORED_FIELDS}
+        
+        # When the scrape finished - part of the ETag of API responses
+        self.last_scrape = last_scrape
+        
+        # Indexes built once here, so statistics and the tag list
+        # can be answered without looping over all quotes
+        # Each index only needs to read one column
+        self.authors = set(self.cols['author'])     # Unique author names
+        self.tag_counts = Counter()                 # How many quotes use each tag
+        for tags in self.cols['tags']:
+            self.tag_counts.update(tags)
+        self.sorted_tags = sorted(self.tag_counts)  # Unique tags in alphabetical order
+        
+        # Remember each row under each of its tags for fast tag filtering
+        # (the tag set makes sure a repeated tag doesn't list the row twice)
+        by_tag = defaultdict(list)
+        for row, tags_set in enumerate(self.cols['tags_set']):
+            for tag in tags_set:
+                by_tag[tag].append(row)
+        self.by_tag = dict(by_tag)                  # Tag -> row numbers of the quotes with that tag
+    
+    def __len__(self):
+        """The number of quotes in this set"""
+        return len(self.cols['id'])
+
 class FlaskQuotesScraper:
     """
     A class that handles web scraping specifically for the Flask web application
@@ -48,6 +370,11 @@ class FlaskQuotesScraper:
     - Designed to work with Flask API endpoints
     """
     
+    # How many more times a page is tried after a dropped connection or a server error (5xx)
+    MAX_RETRIES = 3
+    # Seconds to wait before the first retry - doubled after every failed attempt
+    RETRY_BACKOFF = 0.3
+    
     def __init__(self):
         """
         Constructor method - initializes the scraper for web use
@@ -55,7 +382,11 @@ class FlaskQuotesScraper:
         Sets up:
         - Target website URL
         - Browser headers to avoid being blocked
-        - Empty list to store scraped quotes
+        - A background event loop with a reusable HTTP session
+          (keeps connections open between requests)
+        - A limit on how many downloads may run at the same time
+        - A cache of already parsed pages
+        - Empty columns to store scraped quotes
         """
         # The base URL of the website we want to scrape
         self.base_url = "https://quotes.toscrape.com"
@@ -63,11 +394,38 @@ class FlaskQuotesScraper:
         # Headers that make our request look like it's coming from a real browser
         # This helps avoid being blocked by websites that detect automated requests
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Ask for compressed pages - a lot fewer bytes travel over the network
+            # Both requests and aiohttp decompress the responses automatically
+            'Accept-Encoding': ACCEPT_ENCODING
         }
         
-        # Initialize an empty list to store all the quotes we scrape
-        self.quotes = []
+        # All downloads run on one event loop in a background thread, which the
+        # scraper owns for as long as the app runs. The aiohttp session lives on
+        # that loop, so connections to the website stay open between scrapes
+        # and we don't pay for a new TCP + TLS handshake every time
+        # Both are created on first use (see _get_loop and _get_session)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._session = None
+        
+        # Maximum number of pages downloaded at the same time, across ALL requests
+        # Many users clicking "Start Scraping" at once still can't flood the website
+        # It can be changed with the SCRAPE_MAX_CONCURRENCY environment variable
+        self.max_concurrency = int(os.getenv('SCRAPE_MAX_CONCURRENCY', '4'))
+        # Every download runs on the scraper's one event loop, so an asyncio
+        # semaphore on that loop limits all requests together
+        # It is created on that loop together with the session (see _get_session)
+        self._sem = None
+        
+        # Cache of pages we have already parsed: URL -> (ETag, quotes)
+        # When the website says a page hasn't changed (HTTP 304),
+        # we reuse the quotes from here instead of downloading and parsing again
+        self._page_cache = {}
+        
+        # The scraped quotes and their indexes, replaced as a whole after each scrape
+        # Readers take this once per call and use only that copy
+        self._data = QuoteData()
         
     def scrape_page(self, page_number):
         """
@@ -78,86 +436,192 @@ class FlaskQuotesScraper:
             
         Returns:
             list: A list of dictionaries containing quote data from this page
+            (public fields only, numbered after the quotes already collected)
         """
-        try:
-            # Construct the URL for the specific page
-            # Page 1 is just the base URL, other pages have /page/X/ added
-            if page_number == 1:
-                url = self.base_url
-            else:
-                url = f"{self.base_url}/page/{page_number}/"
-            
-            # Make an HTTP GET request to the website
-            # This is like visiting the webpage in your browser
-            response = requests.get(url, headers=self.headers)
-            
-            # Check if the request was successful (status code 200)
-            # If not, this will raise an exception
-            response.raise_for_status()
-            
-            # Parse the HTML content of the webpage
-            # BeautifulSoup makes it easy to extract information from HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all HTML elements that contain quotes
-            # We're looking for <div> elements with class="quote"
-            quote_elements = soup.find_all('div', class_='quote')
-            
-            # Create a list to store quotes from this specific page
-            page_quotes = []
+        # Download and parse the page on the scraper's event loop,
+        # using the same open connections as the full scrape
+        page_quotes = self._run(self._scrape_page_async(page_number))
+        
+        # A page from the cache keeps the IDs it was parsed with,
+        # so every quote gets its ID here - and the lookup helpers are left out
+        start_id = len(self._data) + 1
+        return [dict({field: quote[field] for field in QUOTE_FIELDS}, id=start_id + i)
+                for i, quote in enumerate(page_quotes)]
+    
+    def _get_loop(self):
+        """
+        Get the scraper's event loop, starting it in a background thread on first use
+        
+        Returns:
+            asyncio.AbstractEventLoop: The loop that runs every download
+        """
+        # The lock makes sure two requests arriving together don't start two loops
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='scraper-loop', daemon=True).start()
+                self._loop = loop
+                # Close the open connections cleanly when the app stops
+                atexit.register(self.close)
+            return self._loop
+    
+    def close(self):
+        """
+        Close the shared HTTP session and stop the background event loop
+        
+        A later scrape simply starts a new loop and session
+        """
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), loop).result()
+            self._session = None
+            self._sem = None
+        loop.call_soon_threadsafe(loop.stop)
+    
+    def _run(self, coro):
+        """
+        Run a coroutine on the scraper's event loop and wait for its result
+        
+        Used by the synchronous methods (e.g. from a Flask request thread)
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+    
+    async def _get_session(self):
+        """
+        Get the shared aiohttp session, creating it on first use
+        
+        The download limit (self._sem) is created here too: on Python 3.9 an
+        asyncio semaphore has to be created while its event loop is running.
+        Only ever called on the scraper's event loop, so no lock is needed
+        
+        Returns:
+            aiohttp.ClientSession: The session used for every download
+        """
+        if self._session is None:
+            # The connector never opens more connections than our concurrency limit
+            # and keeps idle connections open for reuse by the next scrape
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+            # Give up on a page after 10 seconds - otherwise a website that stops
+            # answering would hold a download slot (and every waiting user) for minutes
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+    
+    def _page_url(self, page_number):
+        """
+        Build the URL for a specific page number
+        
+        Page 1 is just the base URL, other pages have /page/X/ added
+        """
+        if page_number == 1:
+            return self.base_url
+        return f"{self.base_url}/page/{page_number}/"
+    
+    def _conditional_headers(self, url):
+        """
+        Build the extra headers for a conditional request
+        
+        Returns:
+            dict: An If-None-Match header if we have an ETag for this URL, otherwise empty
+        """
+        cached = self._page_cache.get(url)
+        if cached:
+            return {'If-None-Match': cached[0]}
+        return {}
+    
+    def _cached_quotes(self, url):
+        """
+        Get a fresh copy of the quotes we parsed for this URL last time
+        
+        Copies are returned so that renumbering the IDs doesn't change the cache
+        """
+        return [dict(quote) for quote in self._page_cache[url][1]]
+    
+    def _remember_page(self, url, etag, page_quotes):
+        """
+        Store the parsed quotes of a page together with its ETag
+        
+        Pages without an ETag (or without quotes) are not cached
+        """
+        if etag and page_quotes:
+            self._page_cache[url] = (etag, [dict(quote) for quote in page_quotes])
+    
+    async def _fetch(self, url):
+        """
+        Download the raw HTML of a single URL without blocking other downloads
+        
+        Args:
+            url (str): The URL to download
             
-            # Loop through each quote element found on the page
-            for quote_element in quote_elements:
+        Returns:
+            tuple: (status code, ETag header, raw HTML content of the page)
+        """
+        # Only a few downloads may run at the same time
+        # This keeps us respectful to the website without sleeping between requests
+        # "async with" gives the slot back even when the download is cancelled
+        session = await self._get_session()
+        async with self._sem:
+            for attempt in range(self.MAX_RETRIES + 1):
                 try:
-                    # Extract the quote text
-                    # Look for a <span> element with class="text" inside the quote div
-                    text_element = quote_element.find('span', class_='text')
-                    # Get the text content and remove extra whitespace
-                    text = text_element.get_text(strip=True) if text_element else ''
-                    
-                    # Extract the author name
-                    # Look for a <small> element with class="author"
-                    author_element = quote_element.find('small', class_='author')
-                    author = author_element.get_text(strip=True) if author_element else ''
-                    
-                    # Extract all the tags
-                    # Look for all <a> elements with class="tag"
-                    tag_elements = quote_element.find_all('a', class_='tag')
-                    # Convert each tag to text and store in a list
-                    tags = [tag.get_text(strip=True) for tag in tag_elements]
-                    
-                    # Only add quotes that have both text and author
-                    # This prevents empty or incomplete quotes from being added
-                    if text and author:
-                        # Create a dictionary with all the quote information
-                        quote_data = {
-                            'id': len(self.quotes) + len(page_quotes) + 1,  # Unique ID for each quote
-                            'text': text,                 # The actual quote text
-                            'author': author,             # Who said the quote
-                            'tags': tags,                 # List of tags (not joined with semicolons)
-                            'page': page_number,          # Which page this quote came from
-                            'timestamp': datetime.now().isoformat()  # When we scraped it
-                        }
-                        # Add this quote to our page quotes list
-                        page_quotes.append(quote_data)
-                        
-                except Exception as e:
-                    # If there's an error parsing a specific quote, print the error
-                    # and continue with the next quote instead of crashing
-                    print(f"Error parsing quote: {e}")
-                    continue
-            
-            # Return the quotes from this page
-            return page_quotes
-            
+                    async with session.get(url, headers=self._conditional_headers(url)) as response:
+                        # A 304 response has no body - the cached quotes are still valid
+                        if response.status == 304:
+                            return response.status, response.headers.get('ETag'), b''
+                        # Server errors (5xx) are often temporary, so they are tried again
+                        if response.status < 500 or attempt == self.MAX_RETRIES:
+                            response.raise_for_status()
+                            return response.status, response.headers.get('ETag'), await response.read()
+                except aiohttp.ClientResponseError:
+                    # Any other error status (e.g. 404) won't change by asking again
+                    raise
+                except aiohttp.ClientError:
+                    # A dropped or refused connection is often temporary as well
+                    if attempt == self.MAX_RETRIES:
+                        raise
+                
+                # Wait a little longer after every failed attempt (0.3s, 0.6s, 1.2s)
+                await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _scrape_page_async(self, page_number):
+        """
+        Download and parse a single page asynchronously
+        
+        Returns:
+            list: A list of dictionaries containing quote data from this page
+        """
+        url = self._page_url(page_number)
+        try:
+            status, etag, html = await self._fetch(url)
         except Exception as e:
-            # Handle any errors that occur during scraping
+            # Handle any errors that occur during downloading
             print(f"Error scraping page {page_number}: {e}")
             return []
+        
+        # The page hasn't changed since last time, so skip parsing entirely
+        if status == 304:
+            return self._cached_quotes(url)
+        
+        # Parse in a worker process so other pages keep downloading meanwhile
+        # and several pages can be parsed at the same time on different CPU cores
+        loop = asyncio.get_running_loop()
+        page_quotes = await loop.run_in_executor(_PARSE_POOL, _parse_quotes, html, page_number)
+        self._remember_page(url, etag, page_quotes)
+        return page_quotes
     
-    def scrape_all_pages(self, max_pages=3):
+    async def scrape_all_pages_async(self, max_pages=3):
         """
-        Scrape quotes from multiple pages
+        Scrape quotes from multiple pages concurrently
+        
+        All pages are requested at the same time, so the total time is close to
+        the time of a single request instead of the sum of all of them.
         
         Args:
             max_pages (int): Maximum number of pages to scrape (default: 3)
@@ -165,26 +629,75 @@ class FlaskQuotesScraper:
         Returns:
             list: All quotes collected from all pages
         """
-        # Reset the quotes list for a fresh scraping session
-        self.quotes = []
+        # The downloads always run on the scraper's own loop, where the shared
+        # session lives - wrap_future lets the caller's loop wait for them
+        future = asyncio.run_coroutine_threadsafe(self._scrape_all_pages(max_pages), self._get_loop())
+        return await asyncio.wrap_future(future)
+    
+    async def _scrape_all_pages(self, max_pages):
+        """
+        Scrape quotes from multiple pages (runs on the scraper's event loop)
         
-        # Loop through each page number from 1 to max_pages
-        for page in range(1, max_pages + 1):
-            # Scrape the current page
-            page_quotes = self.scrape_page(page)
-            
-            # If we found quotes on this page, add them to our main quotes list
-            if page_quotes:
-                # Extend our main quotes list with the quotes from this page
-                self.quotes.extend(page_quotes)
-            
-            # Be respectful to the website - add a delay between requests
-            # This prevents overwhelming their server and getting blocked
-            if page < max_pages:
-                time.sleep(1)  # Wait 1 second before the next request
+        Returns:
+            list: All quotes collected from all pages
+        """
+        # All pages are requested at the same time over the shared session
+        results = await asyncio.gather(*[
+            self._scrape_page_async(page)
+            for page in range(1, max_pages + 1)
+        ])
+        
+        # Combine the pages in order into fresh columns
+        cols = {field: [] for field in STORED_FIELDS}
+        for page_quotes in results:
+            for field in STORED_FIELDS:
+                cols[field].extend(quote[field] for quote in page_quotes)
+        
+        # Pages were parsed independently, so give every quote its final ID here
+        cols['id'] = list(range(1, len(cols['text']) + 1))
+        
+        # Build everything first, then publish it with one assignment
+        data = QuoteData(cols, datetime.now().isoformat())
+        self._data = data
         
         # Return all collected quotes
-        return self.quotes
+        return self._rows(data, range(len(data)))
+    
+    @property
+    def quotes(self):
+        """
+        All collected quotes as a list of dictionaries (public fields only)
+        
+        The dictionaries are built on demand from the stored columns
+        """
+        data = self._data
+        return self._rows(data, range(len(data)))
+    
+    def _rows(self, data, indexes):
+        """
+        Build quote dictionaries for the given row numbers
+        
+        Args:
+            data (QuoteData): The set of quotes the row numbers refer to
+            indexes: Row numbers in the stored columns
+            
+        Returns:
+            list: One dictionary per row, containing the public quote fields
+        """
+        columns = [data.cols[field] for field in QUOTE_FIELDS]
+        return [dict(zip(QUOTE_FIELDS, [column[i] for column in columns])) for i in indexes]
+    
+    def scrape_all_pages(self, max_pages=3):
+        """
+        Scrape quotes from multiple pages (synchronous wrapper)
+        
+        Args:
+            max_pages (int): Maximum number of pages to scrape (default: 3)
+            
+        Returns:
+            list: All quotes collected from all pages
+        """
+        return self._run(self._scrape_all_pages(max_pages))
     
     def get_stats(self):
         """
@@ -193,33 +706,40 @@ class FlaskQuotesScraper:
         Returns:
             dict: Dictionary containing total quotes, unique authors, and unique tags
         """
-        # Check if we have any quotes to get stats for
-        if not self.quotes:
-            return {
-                'total_quotes': 0,
-                'unique_authors': 0,
-                'unique_tags': 0
-            }
-        
-        # Count unique authors
-        # We use a set to automatically remove duplicates
-        authors = set(quote['author'] for quote in self.quotes)
-        
-        # Count unique tags
-        all_tags = []
-        for quote in self.quotes:
-            # Since tags is now a list, we can extend directly
-            all_tags.extend(quote['tags'])
-        # Convert to set to remove duplicates
-        unique_tags = set(all_tags)
-        
-        # Return statistics as a dictionary
+        # The indexes are already up to date, so this is just counting
+        data = self._data
         return {
-            'total_quotes': len(self.quotes),
-            'unique_authors': len(authors),
-            'unique_tags': len(unique_tags)
+            'total_quotes': len(data),
+            'unique_authors': len(data.authors),
+            'unique_tags': len(data.tag_counts)
         }
     
+    def etag(self, *parts):
+        """
+        Build a short fingerprint of an API response
+        
+        The fingerprint only changes when a new scrape happens or when the
+        request parameters (the parts) are different
+        
+        Args:
+            *parts: Values that make this response unique (e.g. search text and tag)
+            
+        Returns:
+            str: A 16-character hexadecimal fingerprint
+        """
+        data = self._data
+        key = '|'.join(str(part) for part in (len(data), data.last_scrape) + parts)
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def get_tags(self):
+        """
+        Get all unique tags from the collected quotes
+        
+        Returns:
+            list: Unique tags sorted alphabetically
+        """
+        return self._data.sorted_tags
+    
     def filter_quotes(self, search_text='', selected_tag=''):
         """
         Filter quotes based on search text and selected tag
@@ -231,30 +751,57 @@ class FlaskQuotesScraper:
         Returns:
             list: Filtered list of quotes that match the criteria
         """
-        # If no filters are applied, return all quotes
-        if not search_text and not selected_tag:
-            return self.quotes
-        
-        # Create a list to store filtered quotes
-        filtered = []
+        # Build dictionaries only for the quotes that matched
+        data = self._data
+        return self._rows(data, self._filter_rows(data, search_text, selected_tag))
+    
+    def export_rows(self, search_text='', selected_tag=''):
+        """
+        Get the filtered quotes as CSV rows
         
-        # Loop through each quote to check if it matches our filters
-        for quote in self.quotes:
-            # Check if quote text or author contains the search text
-            # Convert both to lowercase for case-insensitive search
-            matches_search = not search_text or \
-                           search_text.lower() in quote['text'].lower() or \
-                           search_text.lower() in quote['author'].lower()
+        Args:
+            search_text (str): Text to search for in quotes and authors
+            selected_tag (str): Specific tag to filter by
             
-            # Check if quote has the selected tag
-            matches_tag = not selected_tag or selected_tag in quote['tags']
+        Returns:
+            list: One tuple per quote, with values in the order of QUOTE_FIELDS
+        """
+        data = self._data
+        columns = [data.cols[field] for field in CSV_COLUMNS]
+        return [tuple(column[i] for column in columns)
+                for i in self._filter_rows(data, search_text, selected_tag)]
+    
+    def _filter_rows(self, data, search_text, selected_tag):
+        """
+        Find the row numbers of the quotes that match the filters
+        
+        Args:
+            data (QuoteData): The set of quotes to search
+            search_text (str): Text to search for in quotes and authors
+            selected_tag (str): Specific tag to filter by
             
-            # Only include quotes that match both search and tag filters
-            if matches_search and matches_tag:
-                filtered.append(quote)
+        Returns:
+            list: Row numbers in the stored columns (a range when nothing is filtered)
+        """
+        # Convert the search text to lowercase once, not once per quote
+        search_lower = search_text.lower()
         
-        # Return the filtered quotes
-        return filtered
+        # When a tag is selected, only the rows with that tag need checking
+        # The tag index already knows exactly which rows those are
+        if selected_tag:
+            rows = data.by_tag.get(selected_tag, [])
+        else:
+            rows = range(len(data))
+        
+        # Check if quote text or author contains the search text
+        # Only the two lowercase columns are read - prepared when the quote was scraped
+        if search_lower:
+            texts_lower = data.cols['text_lower']
+            authors_lower = data.cols['author_lower']
+            rows = [i for i in rows
+                    if search_lower in texts_lower[i] or search_lower in authors_lower[i]]
+        
+        return rows
 
 # Create a global scraper instance that will be used by all API endpoints
 # This means the scraper maintains its state (quotes) between different requests
@@ -296,14 +843,15 @@ def api_scrape():
         max_pages = data.get('max_pages', 3)
         
         # Start scraping quotes from the website
+        # The pages are downloaded concurrently on the scraper's background event loop
         quotes = scraper.scrape_all_pages(max_pages)
         
         # Get statistics about the scraped quotes
         stats = scraper.get_stats()
         
         # Return a successful response with the quotes and statistics
-        # jsonify converts Python dictionaries to JSON format
-        return jsonify({
+        # ojson converts Python dictionaries to JSON format
+        return ojson({
             'success': True,                    # Indicates the operation was successful
             'quotes': quotes,                   # The actual quote data
             'stats': stats,                     # Statistics about the quotes
@@ -313,10 +861,10 @@ def api_scrape():
     except Exception as e:
         # If any error occurs, return an error response
         # HTTP status code 500 means "Internal Server Error"
-        return jsonify({
+        return ojson({
             'success': False,                   # Indicates the operation failed
             'error': str(e)                     # The error message
-        }), 500
+        }, 500)
 
 @app.route('/api/quotes')
 def api_quotes():
@@ -337,15 +885,18 @@ def api_quotes():
     search_text = request.args.get('search', '')      # Default to empty string if not provided
     selected_tag = request.args.get('tag', '')        # Default to empty string if not provided
     
-    # Filter quotes based on the search parameters
-    filtered_quotes = scraper.filter_quotes(search_text, selected_tag)
+    def build_payload():
+        # Filter quotes based on the search parameters
+        filtered_quotes = scraper.filter_quotes(search_text, selected_tag)
+        
+        return {
+            'success': True,
+            'quotes': filtered_quotes,
+            'total': len(filtered_quotes)
+        }
     
-    # Return the filtered quotes
-    return jsonify({
-        'success': True,
-        'quotes': filtered_quotes,
-        'total': len(filtered_quotes)
-    })
+    # Return the filtered quotes (or "304 Not Modified" if the browser already has them)
+    return conditional_ojson(scraper.etag('quotes', search_text, selected_tag), build_payload)
 
 @app.route('/api/stats')
 def api_stats():
@@ -355,13 +906,10 @@ def api_stats():
     Returns:
         JSON with total quotes, unique authors, and unique tags
     """
-    # Get statistics from the scraper
-    stats = scraper.get_stats()
-    
-    # Return the statistics as JSON
-    return jsonify({
+    # Return the statistics as JSON (or "304 Not Modified" if the browser already has them)
+    return conditional_ojson(scraper.etag('stats'), lambda: {
         'success': True,
-        'stats': stats
+        'stats': scraper.get_stats()
     })
 
 @app.route('/api/export')
@@ -371,8 +919,8 @@ def api_export():
     
     This endpoint:
     1. Accepts optional search and tag parameters for filtering
-    2. Creates a CSV file in memory
-    3. Sends the file to the browser for download
+    2. Generates the CSV file row by row
+    3. Streams the file to the browser for download
     
     Query Parameters:
         search: Text to search for in quotes and authors
@@ -384,61 +932,65 @@ def api_export():
         selected_tag = request.args.get('tag', '')
         
         # Filter quotes based on the search parameters
-        filtered_quotes = scraper.filter_quotes(search_text, selected_tag)
+        # The rows come back ready for the CSV file (tags already joined)
+        rows = scraper.export_rows(search_text, selected_tag)
         
         # Check if we have any quotes to export
-        if not filtered_quotes:
-            return jsonify({
+        if not rows:
+            return ojson({
                 'success': False,
                 'error': 'No quotes to export'
-            }), 400  # HTTP 400 means "Bad Request"
-        
-        # Create a CSV file in memory (not on disk)
-        # This is more efficient for web applications
-        output = io.StringIO()
-        
-        # Create a CSV writer with the appropriate column headers
-        writer = csv.DictWriter(output, fieldnames=['id', 'text', 'author', 'tags', 'page', 'timestamp'])
-        
-        # Write the header row (column names)
-        writer.writeheader()
+            }, 400)  # HTTP 400 means "Bad Request"
         
-        # Write each quote as a row in the CSV file
-        for quote in filtered_quotes:
-            writer.writerow({
-                'id': quote['id'],
-                'text': quote['text'],
-                'author': quote['author'],
-                'tags': '; '.join(quote['tags']),  # Join tags with semicolons for CSV
-                'page': quote['page'],
-                'timestamp': quote['timestamp']
-            })
-        
-        # Prepare the response
-        # seek(0) moves the file pointer to the beginning
-        output.seek(0)
+        def generate():
+            """
+            Produce the CSV file one row at a time
+            
+            Each row is written into a small buffer, handed to the browser,
+            and the buffer is emptied again, so the whole file never has to
+            exist in memory at once
+            """
+            # The CSV writer writes text, the TextIOWrapper encodes it to UTF-8
+            # bytes straight into the byte buffer - no separate encoding step
+            buffer = io.BytesIO()
+            text = io.TextIOWrapper(buffer, encoding='utf-8', newline='', write_through=True)
+            
+            # Create a CSV writer (rows are tuples, so no per-row dictionaries)
+            writer = csv.writer(text)
+            
+            # Write the header row (column names)
+            writer.writerow(QUOTE_FIELDS)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            
+            # Write each quote as a row in the CSV file
+            for row in rows:
+                writer.writerow(row)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
         
         # Create a filename with current timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"quotes_export_{timestamp}.csv"
         
-        # Send the CSV file to the browser
+        # Stream the CSV file to the browser while it is being generated
         # mimetype='text/csv' tells the browser this is a CSV file
-        # as_attachment=True makes the browser download the file instead of displaying it
-        # download_name sets the filename for the downloaded file
-        return send_file(
-            io.BytesIO(output.getvalue().encode('utf-8')),  # Convert string to bytes
+        # Content-Disposition: attachment makes the browser download the file
+        # instead of displaying it, and sets the filename for the downloaded file
+        return Response(
+            generate(),
             mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
         )
         
     except Exception as e:
         # If any error occurs, return an error response
-        return jsonify({
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/tags')
 def api_tags():
@@ -448,37 +1000,31 @@ def api_tags():
     Returns:
         JSON with a list of all unique tags from collected quotes
     """
-    # Check if we have any quotes to get tags from
-    if not scraper.quotes:
-        return jsonify({
-            'success': True,
-            'tags': []
-        })
-    
-    # Get all tags from all quotes
-    all_tags = []
-    for quote in scraper.quotes:
-        # Since tags is a list, we can extend directly
-        all_tags.extend(quote['tags'])
-    
-    # Remove duplicates and sort alphabetically
-    unique_tags = sorted(list(set(all_tags)))
-    
-    # Return the unique tags as JSON
-    return jsonify({
+    # The sorted tag list is prepared once after each scrape
+    return ojson({
         'success': True,
-        'tags': unique_tags
+        'tags': scraper.get_tags()
     })
 
 # This is the main entry point when running the Flask app directly
 if __name__ == '__main__':
-    # Print startup messages
-    print("🚀 Starting Flask Quotes Scraper Web App...")
-    print("📱 Open your browser and go to: http://localhost:5000")
-    print("🔧 API endpoints available at: http://localhost:5000/api/")
-    
-    # Run the Flask application
-    # debug=True enables debug mode (shows detailed error messages)
-    # host='0.0.0.0' makes the app accessible from other devices on the network
-    # port=5001 sets the port number (5000 is Flask's default, we use 5001 to avoid conflicts)
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Flask's built-in server handles one request at a time and is meant for development only
+    # It only starts when FLASK_DEV is set, e.g.: FLASK_DEV=1 python flask_app.py
+    if os.getenv('FLASK_DEV'):
+        # Print startup messages
+        print("🚀 Starting Flask Quotes Scraper Web App (development server)...")
+        print("📱 Open your browser and go to: http://localhost:5001")
+        print("🔧 API endpoints available at: http://localhost:5001/api/")
+        
+        # Run the Flask application
+        # debug=True enables debug mode (shows detailed error messages)
+        # host='0.0.0.0' makes the app accessible from other devices on the network
+        # port=5001 sets the port number (5000 is Flask's default, we use 5001 to avoid conflicts)
+        app.run(debug=True, host='0.0.0.0', port=5001)
+    else:
+        # In production, run the app with gunicorn, which serves many requests at once
+        # We use ONE worker process with several threads: the scraped quotes live in
+        # memory, and separate worker processes would each have their own copy
+        print("🚀 To start the Flask Quotes Scraper Web App, run:")
+        print("   gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5001 flask_app:app")
+        print("🔧 For the development server instead, run: FLASK_DEV=1 python flask_app.py")
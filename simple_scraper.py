@@ -11,13 +11,298 @@ This script demonstrates basic web scraping concepts:
 """
 
 # Import required libraries
+import asyncio          # For running many page downloads at the same time
+import httpx            # For making asynchronous HTTP/2 requests to websites
 import requests          # For making HTTP requests to websites
-from bs4 import BeautifulSoup  # For parsing HTML content
+from requests.adapters import HTTPAdapter  # For reusing connections between requests
+from urllib3.util.retry import Retry       # For retrying failed requests automatically
+from bs4 import BeautifulSoup, SoupStrainer  # For parsing HTML content
 import csv              # For creating and writing CSV files
-import time             # For adding delays between requests
+import hashlib          # For turning page URLs into short file names
+from collections import Counter  # For counting how often each author and tag appears
+from itertools import chain      # For going through many lists as if they were one
+from concurrent.futures import ProcessPoolExecutor  # For parsing pages on all CPU cores
+import json             # For saving the page cache between runs (if orjson is missing)
+import logging          # For progress and error messages
+import os               # For checking whether files exist
+import random           # For adding random jitter to our delays
+import threading        # For sharing the rate limiter between threads
+import time             # For measuring time and waiting between requests
 from datetime import datetime  # For working with dates and times
 import sys              # For accessing command-line arguments
 
+# Progress and error messages go through this logger instead of print(), so
+# they can be turned down (see --quiet) and are only formatted when shown
+logger = logging.getLogger('quotes_scraper')
+
+# orjson reads and writes the page cache file much faster than the built-in
+# json module. It is optional - without it we fall back to json.
+# Both versions work with bytes, so the file is always opened in binary mode.
+try:
+    import orjson
+    
+    def dump_json(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    load_json = orjson.loads
+except ImportError:
+    def dump_json(data):
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    load_json = json.loads
+
+# lxml is a fast HTML parser written in C. BeautifulSoup can use it if it is
+# installed; otherwise we fall back to Python's built-in (slower) parser.
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+# requests-cache keeps downloaded pages in a local database, so running the
+# scraper again within the hour doesn't need the network at all.
+# It is optional - without it every run downloads the pages again.
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Tells BeautifulSoup to only build the <div class="quote"> parts of a page
+# and skip everything else (header, sidebar, footer...), which we never look at
+QUOTE_STRAINER = SoupStrainer('div', class_='quote')
+
+# Ask the website for compressed pages (much less data to download)
+# Brotli ("br") is only requested when the brotli package is installed,
+# because only then can requests and httpx decode it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# The information we store for every quote (also the columns of the CSV file)
+FIELDNAMES = ['id', 'text', 'author', 'tags', 'page', 'timestamp']
+
+
+def new_columns():
+    """
+    Create an empty set of quote columns
+    
+    Instead of keeping one dictionary per quote, we keep one list per field
+    (all texts together, all authors together, ...). The quote at position i
+    is made of the i-th value of every list. Code that only needs one field,
+    like counting authors, then only has to look at that one list.
+    
+    Returns:
+        dict: Field name -> empty list, for every field in FIELDNAMES
+    """
+    return {field: [] for field in FIELDNAMES}
+
+
+def csv_rows(columns):
+    """
+    Turn quote columns into CSV rows
+    
+    Tags are stored as a list and only joined with semicolons here, when
+    they are written to the file.
+    
+    Args:
+        columns (dict): Quote columns (see new_columns)
+        
+    Returns:
+        iterator: One tuple of values per quote, in FIELDNAMES order
+    """
+    return zip(
+        columns['id'],
+        columns['text'],
+        columns['author'],
+        map('; '.join, columns['tags']),
+        columns['page'],
+        columns['timestamp']
+    )
+
+
+class RateLimiter:
+    """
+    A token bucket that limits how fast we send requests to the website
+    
+    The bucket holds up to `capacity` tokens and gains `refill_rate` tokens per
+    second. Every request takes one token; when the bucket is empty we wait
+    just long enough for the next token instead of sleeping a fixed amount.
+    
+    On top of that, each request waits a base delay (TD) plus a random extra
+    delay between 0 and RID seconds, so our requests don't arrive in a
+    perfectly regular pattern.
+    """
+    
+    def __init__(self, capacity=5, refill_rate=5.0, td=0.0, rid=0.3):
+        """
+        Args:
+            capacity (int): Maximum number of requests that can be sent in a burst
+            refill_rate (float): Number of requests allowed per second on average
+            td (float): Base delay in seconds added before every request
+            rid (float): Maximum random delay in seconds added before every request
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.td = td
+        self.rid = rid
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        # Requests may come from several threads at once (see SimpleQuotesScraper._fetch)
+        self._lock = threading.Lock()
+    
+    def _take(self):
+        """
+        Try to take one token from the bucket
+        
+        Returns:
+            float: 0 if a token was taken, otherwise how many seconds to wait
+        """
+        with self._lock:
+            # Add the tokens that were earned since the last time we checked
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.refill_rate
+    
+    def _delay(self):
+        """
+        The base delay plus a random incremental delay
+        """
+        return self.td + random.uniform(0, self.rid)
+    
+    async def acquire(self):
+        """
+        Wait until we are allowed to send the next request (asynchronous version)
+        """
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
+        await asyncio.sleep(self._delay())
+    
+    def acquire_sync(self):
+        """
+        Wait until we are allowed to send the next request (for code that isn't asynchronous)
+        """
+        while (wait := self._take()) > 0:
+            time.sleep(wait)
+        time.sleep(self._delay())
+
+
+def retry_delay(headers, attempt):
+    """
+    Work out how long to wait after the website answered "429 Too Many Requests"
+    
+    We use the Retry-After header if the website sent one, otherwise we wait
+    twice as long as last time (1, 2, 4, 8... seconds). A random extra of up
+    to half that time is added so that many clients don't all retry at once.
+    
+    Args:
+        headers (dict): The response headers
+        attempt (int): How many times we have already tried (starting at 0)
+        
+    Returns:
+        float: The number of seconds to wait before trying again
+    """
+    try:
+        retry_after = float(headers.get('Retry-After', 2 ** attempt))
+    except ValueError:
+        # Retry-After can also be a date - just fall back to our own backoff
+        retry_after = 2 ** attempt
+    return retry_after + random.uniform(0, 0.5 * retry_after)
+
+
+def _parse_html(html, page_number, start_id=1, scraped_at=None):
+    """
+    Extract quotes from the HTML of a single page
+    
+    This is a plain function (not a method) so it can run in a separate
+    process: it only uses its arguments and doesn't touch the scraper.
+    
+    Args:
+        html (str): The HTML content of the page
+        page_number (int): The page number the HTML came from
+        start_id (int): The ID to give the first quote on this page (default: 1)
+        scraped_at (str, optional): When the page was downloaded, in ISO format.
+                                    If not provided, the current time is used.
+        
+    Returns:
+        dict: The quote columns of this page (see new_columns)
+    """
+    try:
+        # Parse the HTML content of the webpage
+        # BeautifulSoup makes it easy to extract information from HTML
+        # Only the quote <div> elements are kept (see QUOTE_STRAINER)
+        soup = BeautifulSoup(html, PARSER, parse_only=QUOTE_STRAINER)
+        
+        # Find all HTML elements that contain quotes
+        # We're looking for <div> elements with class="quote"
+        # They are the only elements at the top level, so there is no need to search deeper
+        quote_elements = soup.find_all('div', class_='quote', recursive=False)
+        
+        # Create columns to store quotes from this specific page
+        page_quotes = new_columns()
+        
+        # All quotes on a page were scraped at the same moment,
+        # so every quote shares one timestamp
+        timestamp = scraped_at or datetime.now().isoformat()
+        
+        # Loop through each quote element found on the page
+        for quote_element in quote_elements:
+            try:
+                # Extract the quote text
+                # Look for a <span> element with class="text" inside the quote div
+                text_element = quote_element.select_one('span.text')
+                # Get the text content and remove extra whitespace
+                text = text_element.get_text(strip=True) if text_element else ''
+                
+                # Extract the author name
+                # Look for a <small> element with class="author"
+                author_element = quote_element.select_one('small.author')
+                author = author_element.get_text(strip=True) if author_element else ''
+                
+                # Extract all the tags
+                # Look for all <a> elements with class="tag"
+                tag_elements = quote_element.select('a.tag')
+                # Convert each tag to text and store in a list
+                # A tag link only contains text, so .string is enough
+                # (get_text would search through all its children)
+                # str() makes a plain string: .string itself still points into
+                # the parse tree and would keep the whole page in memory
+                tags = [str(tag.string) for tag in tag_elements if tag.string]
+                
+                # Only add quotes that have both text and author
+                # This prevents empty or incomplete quotes from being added
+                if text and author:
+                    # Add the quote information to the end of every column
+                    page_quotes['id'].append(start_id + len(page_quotes['id']))  # A unique ID
+                    page_quotes['text'].append(text)               # The actual quote text
+                    page_quotes['author'].append(author)           # Who said the quote
+                    page_quotes['tags'].append(tags)               # The list of tags
+                    page_quotes['page'].append(page_number)        # Which page this quote came from
+                    page_quotes['timestamp'].append(timestamp)     # When we scraped it
+                    
+            except Exception as e:
+                # If there's an error parsing a specific quote, print the error
+                # and continue with the next quote instead of crashing
+                logger.warning("Error parsing quote: %s", e)
+                continue
+        
+        # Return the quotes from this page
+        # (the caller reports how many were found: this function may run in a
+        # worker process, which doesn't share the logging setup of main())
+        return page_quotes
+        
+    except Exception as e:
+        # Handle any errors that occur while parsing
+        logger.error("Unexpected error on page %d: %s", page_number, e)
+        return new_columns()
+
+
 class SimpleQuotesScraper:
     """
     A class that handles web scraping of quotes from quotes.toscrape.com
@@ -29,27 +314,147 @@ class SimpleQuotesScraper:
     - Data processing and storage
     """
     
-    def __init__(self):
+    # How many times we try a page when the website keeps answering 429
+    MAX_ATTEMPTS = 6
+    
+    # Change this whenever the way quotes are stored in the page cache changes
+    ETAG_CACHE_VERSION = 3
+    
+    # Browsers we pretend to be - a different one is picked for every request,
+    # so our requests don't all carry the same easily recognised fingerprint
+    USER_AGENTS = [
+        # Chrome on Windows, macOS and Linux
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+        # Edge on Windows
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36 Edg/123.0.0.0',
+        # Firefox on Windows, macOS and Linux
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:124.0) Gecko/20100101 Firefox/124.0',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 13.6; rv:124.0) Gecko/20100101 Firefox/124.0',
+        'Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0',
+        'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:124.0) Gecko/20100101 Firefox/124.0',
+        # Safari on macOS
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4.1 Safari/605.1.15',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 13_6_6) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 12_7_4) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Safari/605.1.15',
+        # Opera and Vivaldi on Windows
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36 OPR/109.0.0.0',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Vivaldi/6.6.3271.61',
+    ]
+    
+    def __init__(self, td=0.0, rid=0.3, use_cache=True):
         """
         Constructor method - runs when creating a new scraper instance
         
         This method initializes the scraper with:
         - The target website URL
         - Browser headers to avoid being blocked
-        - An empty list to store scraped quotes
+        - A reusable HTTP session (keeps connections open between requests),
+          with a local cache of downloaded pages if requests-cache is installed
+        - A rate limiter so we don't overload the website
+        - A cache of page ETags, loaded from the previous run
+        - Empty columns to store scraped quotes
+        
+        Args:
+            td (float): Base delay in seconds before every request (default: 0)
+            rid (float): Maximum random extra delay in seconds before every request (default: 0.3)
+            use_cache (bool): Keep downloaded pages in a local cache for an hour (default: True)
         """
         # The base URL of the website we want to scrape
         self.base_url = "https://quotes.toscrape.com"
         
         # Headers that make our request look like it's coming from a real browser
         # Some websites block automated requests, so this helps avoid detection
+        # (the User-Agent is picked at random for every request, see _request_headers)
+        # We also ask for HTML only, and for compressed responses
+        # (both libraries decompress them for us automatically)
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Encoding': ACCEPT_ENCODING
         }
         
-        # Initialize an empty list to store all the quotes we scrape
-        self.quotes = []
+        # A session keeps the connection to the website open between requests
+        # so we don't pay for a new TCP + TLS handshake on every page
+        # The cached session also stores every page in quotes_http_cache.sqlite:
+        # - pages are reused for an hour (or as long as the website allows)
+        # - if the website fails or rate limits us, an older copy is used instead
+        self.http_cache = use_cache and requests_cache is not None
+        if self.http_cache:
+            self.session = requests_cache.CachedSession(
+                'quotes_http_cache',
+                backend='sqlite',
+                expire_after=3600,
+                cache_control=True,
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # The adapter holds a pool of connections and retries failed requests
+        # It waits a little longer after each failure
+        # (429 "Too Many Requests" is handled by our own retry loop instead)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Every request waits for the rate limiter before it is sent
+        self.limiter = RateLimiter(td=td, rid=rid)
+        
+        # Cache of pages we have already parsed: URL -> (ETag, page file name)
+        # An ETag is a fingerprint the website gives each version of a page.
+        # We send it back next time; if the page hasn't changed, the website
+        # answers "304 Not Modified" with no content and we reuse our quotes.
+        # Only the ETags are kept in memory - the quotes of each page are
+        # written to their own file in the cache folder and read back when needed,
+        # so memory use doesn't grow with the number of pages.
+        # The cache is saved to disk so it also works across runs.
+        self.etag_cache_dir = 'etag_cache'
+        self.etag_cache_file = os.path.join(self.etag_cache_dir, 'index.json')
+        self._etag_cache = self._load_etag_cache()
+        
+        # Initialize empty columns to store all the quotes we scrape
+        # (one list per field - see new_columns)
+        self._cols = new_columns()
+        
+        # Running totals, updated as each page comes in, so that statistics
+        # never need to go through all the quotes again
+        self._total = 0          # Number of quotes collected
+        self._authors = Counter()  # How many quotes each author has
+        self._tags = Counter()     # How many quotes use each tag
+        self._sample = []        # The first few (text, author) pairs
         
+        # When set to a CSV writer, quotes are written to the file as soon as
+        # each page is scraped instead of being kept in memory (see run)
+        self._writer = None
+    
+    @property
+    def quotes(self):
+        """
+        All scraped quotes as a list of dictionaries
+        
+        The quotes are stored as columns; this builds the dictionaries on demand
+        for code that prefers one dictionary per quote.
+        """
+        return [dict(zip(FIELDNAMES, row)) for row in zip(*(self._cols[field] for field in FIELDNAMES))]
+    
     def scrape_page(self, page_number):
         """
         Scrape quotes from a specific page number
@@ -58,127 +463,436 @@ class SimpleQuotesScraper:
             page_number (int): The page number to scrape (1, 2, 3, etc.)
             
         Returns:
-            list: A list of dictionaries containing quote data from this page
+            dict: The quote columns of this page (see new_columns)
         """
         try:
             # Construct the URL for the specific page
-            # Page 1 is just the base URL, other pages have /page/X/ added
-            if page_number == 1:
-                url = self.base_url
-            else:
-                url = f"{self.base_url}/page/{page_number}/"
+            url = self._page_url(page_number)
             
             # Print a message showing which page we're currently scraping
-            print(f"Scraping page {page_number}: {url}")
+            logger.info("Scraping page %d: %s", page_number, url)
             
-            # Make an HTTP GET request to the website
+            # Make an HTTP GET request to the website using our shared session
             # This is like visiting the webpage in your browser
-            response = requests.get(url, headers=self.headers)
+            # (a second request is only made if our cached copy of the page is broken)
+            for _ in range(2):
+                response = self._get(url)
+                if response.status_code != 304:
+                    break
+                
+                # HTTP 304 means "Not Modified" - reuse the quotes we parsed last time
+                try:
+                    return self._cached_quotes(url, page_number, len(self._cols['id']) + 1)
+                except (OSError, ValueError, KeyError) as e:
+                    self._forget_page(url, page_number, e)
             
             # Check if the request was successful (status code 200)
             # If not, this will raise an exception
             response.raise_for_status()
             
-            # Parse the HTML content of the webpage
-            # BeautifulSoup makes it easy to extract information from HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all HTML elements that contain quotes
-            # We're looking for <div> elements with class="quote"
-            quote_elements = soup.find_all('div', class_='quote')
-            
-            # Create a list to store quotes from this specific page
-            page_quotes = []
-            
-            # Loop through each quote element found on the page
-            for quote_element in quote_elements:
-                try:
-                    # Extract the quote text
-                    # Look for a <span> element with class="text" inside the quote div
-                    text_element = quote_element.find('span', class_='text')
-                    # Get the text content and remove extra whitespace
-                    text = text_element.get_text(strip=True) if text_element else ''
-                    
-                    # Extract the author name
-                    # Look for a <small> element with class="author"
-                    author_element = quote_element.find('small', class_='author')
-                    author = author_element.get_text(strip=True) if author_element else ''
-                    
-                    # Extract all the tags
-                    # Look for all <a> elements with class="tag"
-                    tag_elements = quote_element.find_all('a', class_='tag')
-                    # Convert each tag to text and store in a list
-                    tags = [tag.get_text(strip=True) for tag in tag_elements]
-                    
-                    # Only add quotes that have both text and author
-                    # This prevents empty or incomplete quotes from being added
-                    if text and author:
-                        # Create a dictionary with all the quote information
-                        quote_data = {
-                            'id': len(self.quotes) + 1,  # Give each quote a unique ID
-                            'text': text,                 # The actual quote text
-                            'author': author,             # Who said the quote
-                            'tags': '; '.join(tags),      # Join tags with semicolons
-                            'page': page_number,          # Which page this quote came from
-                            'timestamp': datetime.now().isoformat()  # When we scraped it
-                        }
-                        # Add this quote to our page quotes list
-                        page_quotes.append(quote_data)
-                        
-                except Exception as e:
-                    # If there's an error parsing a specific quote, print the error
-                    # and continue with the next quote instead of crashing
-                    print(f"Error parsing quote: {e}")
-                    continue
-            
+            # Extract the quotes from the downloaded HTML
+            page_quotes = _parse_html(
+                self._response_text(response), page_number, len(self._cols['id']) + 1, datetime.now().isoformat()
+            )
             # Print how many quotes we found on this page
-            print(f"Found {len(page_quotes)} quotes on page {page_number}")
-            
-            # Return the quotes from this page
+            logger.info("Found %d quotes on page %d", len(page_quotes['id']), page_number)
+            self._remember_page(url, response.headers.get('ETag'), page_quotes)
             return page_quotes
             
         except requests.RequestException as e:
             # Handle errors related to HTTP requests (network issues, bad URLs, etc.)
-            print(f"Error scraping page {page_number}: {e}")
-            return []
+            logger.error("Error scraping page %d: %s", page_number, e)
+            return new_columns()
         except Exception as e:
             # Handle any other unexpected errors
-            print(f"Unexpected error on page {page_number}: {e}")
-            return []
+            logger.error("Unexpected error on page %d: %s", page_number, e)
+            return new_columns()
     
-    def scrape_all_pages(self, max_pages=5):
+    def _get(self, url):
         """
-        Scrape quotes from multiple pages
+        Download a URL with our shared session, retrying when we are rate limited
+        
+        The session already sends our browser headers; if we have seen
+        this page before, we also send its ETag
         
         Args:
-            max_pages (int): Maximum number of pages to scrape (default: 5)
+            url (str): The URL to download
+            
+        Returns:
+            requests.Response: The response from the website (or from the local cache)
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            # Fresh pages in the local cache don't touch the website, so they don't need to wait
+            # (an expired page is revalidated with the website, so it waits like any other request)
+            if not self._fresh_in_cache(url):
+                self.limiter.acquire_sync()
+            response = self.session.get(url, headers=self._request_headers(url), timeout=10)
+            
+            # HTTP 429 means "Too Many Requests" - wait and try again
+            if response.status_code != 429 or attempt == self.MAX_ATTEMPTS - 1:
+                break
+            wait = retry_delay(response.headers, attempt)
+            logger.warning("%s was rate limited, retrying in %.1fs", url, wait)
+            time.sleep(wait)
+        
+        if getattr(response, 'from_cache', False):
+            logger.info("Loaded %s from the local HTTP cache", url)
+        return response
+    
+    def _fresh_in_cache(self, url):
+        """
+        Check whether the local HTTP cache can answer a request for this URL by itself
+        
+        Returns:
+            bool: True if the page is cached and has not expired yet
+        """
+        if not self.http_cache:
+            return False
+        key = self.session.cache.create_key(requests.Request('GET', url))
+        cached = self.session.cache.get_response(key)
+        return cached is not None and not cached.is_expired
+    
+    def _response_text(self, response):
+        """
+        Get the text of a response, decoded only once
+        
+        The website normally says which character set it uses in the
+        Content-Type header. If it doesn't, requests would fall back to an old
+        default (ISO-8859-1), so we use UTF-8 instead of guessing from the content.
+        
+        Args:
+            response (requests.Response or httpx.Response): The response to decode
+            
+        Returns:
+            str: The decoded HTML
+        """
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        return response.text
+    
+    def _page_url(self, page_number):
+        """
+        Build the URL for a specific page number
+        
+        Page 1 is just the base URL, other pages have /page/X/ added
+        """
+        if page_number == 1:
+            return self.base_url
+        return f"{self.base_url}/page/{page_number}/"
+    
+    def _load_etag_cache(self):
+        """
+        Load the page cache saved by a previous run
+        
+        Returns:
+            dict: URL -> (ETag, page file name), or an empty dict if there is no usable cache
+        """
+        if not os.path.exists(self.etag_cache_file):
+            return {}
+        
+        try:
+            with open(self.etag_cache_file, 'rb') as f:
+                data = load_json(f.read())
+            # A cache written by an older version stores quotes differently - skip it
+            if data.get('version') != self.ETAG_CACHE_VERSION:
+                return {}
+            return {url: tuple(entry) for url, entry in data['pages'].items()}
+        except (OSError, ValueError, AttributeError, KeyError) as e:
+            # A broken cache file is not a problem - we just download everything again
+            logger.warning("Ignoring unreadable cache file %s: %s", self.etag_cache_file, e)
+            return {}
+    
+    def _save_etag_cache(self):
+        """
+        Save the list of cached pages so the next run can use it
+        
+        The quotes themselves were already written by _remember_page
+        """
+        try:
+            os.makedirs(self.etag_cache_dir, exist_ok=True)
+            with open(self.etag_cache_file, 'wb') as f:
+                f.write(dump_json({'version': self.ETAG_CACHE_VERSION, 'pages': self._etag_cache}))
+        except OSError as e:
+            logger.warning("Could not save cache file %s: %s", self.etag_cache_file, e)
+    
+    def _request_headers(self, url):
+        """
+        Build the headers for one request
+        
+        Every request gets our standard headers, a randomly chosen browser
+        User-Agent and, if we have seen the page before, its ETag.
+        """
+        return {
+            **self.headers,
+            'User-Agent': random.choice(self.USER_AGENTS),
+            **self._conditional_headers(url)
+        }
+    
+    def _conditional_headers(self, url):
+        """
+        Build the extra headers for a conditional request
+        
+        Returns:
+            dict: An If-None-Match header if we have an ETag for this URL, otherwise empty
+        """
+        etag, filename = self._etag_cache.get(url, (None, None))
+        # Without the saved quotes a "304 Not Modified" would be useless,
+        # so only ask for it when the page file is still there
+        if etag and os.path.exists(os.path.join(self.etag_cache_dir, filename)):
+            return {'If-None-Match': etag}
+        return {}
+    
+    def _cached_quotes(self, url, page_number, start_id=1):
+        """
+        Read the quotes we parsed for this URL last time from the cache folder
+        
+        The cached quotes still carry the IDs and the time of the scrape that
+        first parsed them, so they are numbered from start_id and stamped with
+        the current time, just like freshly parsed quotes
+        
+        Args:
+            url (str): The URL of the page
+            page_number (int): The page number (for the progress message)
+            start_id (int): The ID to give the first quote
+        """
+        with open(os.path.join(self.etag_cache_dir, self._etag_cache[url][1]), 'rb') as f:
+            cached_quotes = load_json(f.read())
+        count = len(cached_quotes['id'])
+        cached_quotes['id'] = list(range(start_id, start_id + count))
+        cached_quotes['timestamp'] = [datetime.now().isoformat()] * count
+        logger.info("Page %d has not changed, reusing %d cached quotes", page_number, len(cached_quotes['id']))
+        return cached_quotes
+    
+    def _forget_page(self, url, page_number, error):
+        """
+        Drop a page from the cache because its saved quotes can't be read
+        
+        Without an ETag for the URL, the next request downloads the whole page again
+        """
+        logger.warning("Cached quotes of page %d are unusable (%s), downloading it again", page_number, error)
+        self._etag_cache.pop(url, None)
+    
+    def _remember_page(self, url, etag, page_quotes):
+        """
+        Save the parsed quotes of a page to the cache folder and remember its ETag
+        
+        Pages without an ETag (or without quotes) are not cached
+        """
+        if not (etag and page_quotes['id']):
+            return
+        
+        # The file name comes from the URL, so a page always uses the same file
+        filename = f"page_{hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]}.json"
+        try:
+            os.makedirs(self.etag_cache_dir, exist_ok=True)
+            with open(os.path.join(self.etag_cache_dir, filename), 'wb') as f:
+                f.write(dump_json(page_quotes))
+        except OSError as e:
+            logger.warning("Could not save page %s to the cache: %s", url, e)
+            return
+        self._etag_cache[url] = (etag, filename)
+    
+    async def _fetch(self, client, url):
         """
-        print(f"Starting to scrape up to {max_pages} pages...")
+        Download the HTML of a single URL without blocking other downloads
+        
+        Args:
+            client (httpx.AsyncClient): The shared HTTP client
+            url (str): The URL to download
+            
+        Returns:
+            tuple: (status code, ETag header, HTML content of the page as text)
+        """
+        if self.http_cache:
+            # The local cache only works with our requests session, so the
+            # download runs in a separate thread to keep the event loop free
+            response = await asyncio.to_thread(self._get, url)
+            if response.status_code == 304:
+                return response.status_code, response.headers.get('ETag'), ''
+            response.raise_for_status()
+            return response.status_code, response.headers.get('ETag'), self._response_text(response)
+        
+        for attempt in range(self.MAX_ATTEMPTS):
+            await self.limiter.acquire()
+            response = await client.get(url, headers=self._request_headers(url))
+            
+            # HTTP 429 means "Too Many Requests" - wait and try again
+            if response.status_code == 429 and attempt < self.MAX_ATTEMPTS - 1:
+                wait = retry_delay(response.headers, attempt)
+                logger.warning("%s was rate limited, retrying in %.1fs", url, wait)
+                await asyncio.sleep(wait)
+                continue
+            
+            # A 304 response has no content - the cached quotes are still valid
+            if response.status_code == 304:
+                return response.status_code, response.headers.get('ETag'), ''
+            
+            # Check if the request was successful (status code 200)
+            response.raise_for_status()
+            return response.status_code, response.headers.get('ETag'), self._response_text(response)
+    
+    async def _scrape_page_async(self, client, executor, page_number):
+        """
+        Download and parse a single page asynchronously
+        
+        The download happens on the event loop, but parsing is handed to a
+        separate process so it doesn't hold up the other downloads.
         
-        # Loop through each page number from 1 to max_pages
-        for page in range(1, max_pages + 1):
-            # Scrape the current page
-            page_quotes = self.scrape_page(page)
+        Args:
+            client (httpx.AsyncClient): The shared HTTP client
+            executor (ProcessPoolExecutor): The worker processes that parse pages
+            page_number (int): The page number to scrape
             
-            # If we found quotes on this page, add them to our main quotes list
-            if page_quotes:
-                # Extend our main quotes list with the quotes from this page
-                self.quotes.extend(page_quotes)
-                # Print progress update
-                print(f"Total quotes collected so far: {len(self.quotes)}")
-            else:
-                # If no quotes were found, stop scraping
-                # This might happen if we've reached the last page
-                print(f"No quotes found on page {page}, stopping...")
+        Returns:
+            dict: The quote columns of this page (see new_columns)
+        """
+        url = self._page_url(page_number)
+        logger.info("Scraping page %d: %s", page_number, url)
+        
+        # A second request is only made if our cached copy of the page is broken
+        for _ in range(2):
+            try:
+                status, etag, html = await self._fetch(client, url)
+            except (httpx.HTTPError, requests.RequestException) as e:
+                # Handle errors related to HTTP requests (network issues, bad URLs, etc.)
+                logger.error("Error scraping page %d: %s", page_number, e)
+                return new_columns()
+            except Exception as e:
+                # Handle any other unexpected errors
+                logger.error("Unexpected error on page %d: %s", page_number, e)
+                return new_columns()
+            if status != 304:
                 break
             
-            # Be respectful to the website - add a delay between requests
-            # This prevents overwhelming their server and getting blocked
-            if page < max_pages:
-                time.sleep(1)  # Wait 1 second before the next request
+            # The page hasn't changed since last time, so skip parsing entirely
+            try:
+                return self._cached_quotes(url, page_number)
+            except (OSError, ValueError, KeyError) as e:
+                self._forget_page(url, page_number, e)
+        
+        loop = asyncio.get_running_loop()
+        # The page was scraped when the download finished, not when a worker
+        # process gets around to parsing it, so read the clock here
+        scraped_at = datetime.now().isoformat()
+        page_quotes = await loop.run_in_executor(executor, _parse_html, html, page_number, 1, scraped_at)
+        # Print how many quotes we found on this page
+        # (here rather than in the worker process, where our log settings don't apply)
+        logger.info("Found %d quotes on page %d", len(page_quotes['id']), page_number)
+        self._remember_page(url, etag, page_quotes)
+        return page_quotes
+    
+    async def _discover_pages(self, client, executor, max_pages):
+        """
+        Scrape page 1 and decide which other pages to request
+        
+        If page 1 has no quotes the website is probably down or has changed,
+        so there is no point in requesting any other page. Otherwise we
+        request all remaining pages at once and simply ignore the ones that
+        turn out to be empty.
+        
+        Returns:
+            tuple: (quote columns of page 1, list of other page numbers to scrape)
+        """
+        first_page = await self._scrape_page_async(client, executor, 1)
+        if not first_page['id']:
+            return first_page, []
+        return first_page, list(range(2, max_pages + 1))
+    
+    async def scrape_all_pages(self, max_pages=5):
+        """
+        Scrape quotes from multiple pages concurrently
+        
+        Page 1 is scraped first to check that there is anything to scrape.
+        After that, all other pages are requested at the same time, so the
+        total time is close to the time of two requests instead of the sum of
+        all of them. Pages are parsed in worker processes, one per CPU core,
+        while other pages are still downloading.
+        
+        Args:
+            max_pages (int): Maximum number of pages to scrape (default: 5)
+        """
+        logger.info("Starting to scrape up to %d pages...", max_pages)
+        
+        # One client is shared by all requests so connections can be reused
+        # It is only used with --no-cache: the local HTTP cache works with our
+        # requests session instead, which downloads in worker threads (see _fetch)
+        # With HTTP/2, all pages are downloaded over a single connection at the
+        # same time (only one TCP + TLS handshake for the whole scrape), so we
+        # keep just one connection alive. Websites that only speak HTTP/1.1
+        # still get at most 10 connections at the same time.
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=1)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            async with httpx.AsyncClient(
+                http2=True, timeout=10.0, limits=limits, follow_redirects=True
+            ) as client:
+                first_page, other_pages = await self._discover_pages(client, executor, max_pages)
+                
+                self._add_page(1, first_page)
+                
+                # Request every other page at once
+                tasks = [
+                    asyncio.create_task(self._scrape_page_async(client, executor, page))
+                    for page in other_pages
+                ]
+                
+                # Handle the pages in order, each one as soon as it is ready,
+                # so earlier pages are stored while later ones are still downloading
+                for page, task in zip(other_pages, tasks):
+                    self._add_page(page, await task)
         
         # Print final summary
-        print(f"\nScraping completed! Total quotes collected: {len(self.quotes)}")
+        print(f"\nScraping completed! Total quotes collected: {self._total}")
+    
+    def _add_page(self, page_number, page_quotes):
+        """
+        Add the quotes of one page to our results
+        
+        Pages must be added in order, because this is where every quote gets
+        its final ID. The quotes are either written straight to the CSV file
+        (if run() opened one) or added to our main columns.
+        
+        Args:
+            page_number (int): The page number the quotes came from
+            page_quotes (dict): The quote columns of this page (see new_columns)
+        """
+        count = len(page_quotes['id'])
+        if not count:
+            # Empty pages are skipped
+            # This happens for pages after the last page of the website
+            logger.info("No quotes found on page %d, skipping...", page_number)
+            return
+        
+        # Pages were parsed independently, so give every quote its final ID here
+        page_quotes['id'] = list(range(self._total + 1, self._total + count + 1))
+        
+        # Update the running totals
+        self._total += count
+        self._authors.update(page_quotes['author'])
+        # chain goes through the tag lists of all quotes on the page in one pass
+        self._tags.update(chain.from_iterable(page_quotes['tags']))
+        missing = 3 - len(self._sample)
+        if missing > 0:
+            self._sample.extend(zip(page_quotes['text'][:missing], page_quotes['author'][:missing]))
+        
+        if self._writer is not None:
+            # Write the rows of this page to the CSV file right away
+            self._writer.writerows(csv_rows(page_quotes))
+        else:
+            # Extend each of our main columns with the same column from this page
+            for field in FIELDNAMES:
+                self._cols[field].extend(page_quotes[field])
+        
+        # Print progress update
+        logger.info("Total quotes collected so far: %d", self._total)
+    
+    def scrape_all_pages_sync(self, max_pages=5):
+        """
+        Scrape quotes from multiple pages (for code that isn't asynchronous)
+        
+        Args:
+            max_pages (int): Maximum number of pages to scrape (default: 5)
+        """
+        asyncio.run(self.scrape_all_pages(max_pages))
     
     def export_to_csv(self, filename=None):
         """
@@ -189,15 +903,13 @@ class SimpleQuotesScraper:
                                     a filename with timestamp will be generated.
         """
         # Check if we have any quotes to export
-        if not self.quotes:
+        if not self._cols['id']:
             print("No quotes to export!")
             return
         
         # If no filename was provided, create one with current timestamp
         if filename is None:
-            # Create timestamp in format: YYYYMMDD_HHMMSS
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"quotes_export_{timestamp}.csv"
+            filename = self._default_filename()
         
         try:
             # Open a file for writing
@@ -205,26 +917,30 @@ class SimpleQuotesScraper:
             # newline='' prevents extra blank lines in CSV
             # encoding='utf-8' ensures proper handling of special characters
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                # Define the column headers for our CSV file
-                fieldnames = ['id', 'text', 'author', 'tags', 'page', 'timestamp']
-                
-                # Create a CSV writer that can handle dictionaries
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                # Create a CSV writer that writes plain lists of values
+                writer = csv.writer(csvfile)
                 
                 # Write the header row (column names)
-                writer.writeheader()
+                writer.writerow(FIELDNAMES)
                 
-                # Write each quote as a row in the CSV file
-                for quote in self.quotes:
-                    writer.writerow(quote)
+                # Write every quote as a row in the CSV file
+                writer.writerows(csv_rows(self._cols))
             
             # Print success message
-            print(f"Successfully exported {len(self.quotes)} quotes to {filename}")
+            print(f"Successfully exported {len(self._cols['id'])} quotes to {filename}")
             
         except Exception as e:
             # Handle any errors that occur during file writing
             print(f"Error exporting to CSV: {e}")
     
+    def _default_filename(self):
+        """
+        Create a CSV filename containing the current date and time
+        """
+        # Create timestamp in format: YYYYMMDD_HHMMSS
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"quotes_export_{timestamp}.csv"
+    
     def display_stats(self):
         """
         Display statistics about the collected quotes
@@ -233,51 +949,62 @@ class SimpleQuotesScraper:
         - Total number of quotes
         - Number of unique authors
         - Number of unique tags
+        - The most common authors and tags
         - Sample quotes
         """
         # Check if we have any quotes to display stats for
-        if not self.quotes:
+        if not self._total:
             print("No quotes collected yet.")
             return
         
         # Print a nice header for the statistics
+        # All numbers come from the running totals kept while scraping
         print("\n" + "="*50)
         print("QUOTES SCRAPER STATISTICS")
         print("="*50)
-        print(f"Total Quotes: {len(self.quotes)}")
+        print(f"Total Quotes: {self._total}")
         
         # Count unique authors
-        # We use a set to automatically remove duplicates
-        authors = set(quote['author'] for quote in self.quotes)
-        print(f"Unique Authors: {len(authors)}")
+        # A Counter has one entry per author, so its length is the number of unique authors
+        print(f"Unique Authors: {len(self._authors)}")
         
         # Count unique tags
-        all_tags = []
-        for quote in self.quotes:
-            if quote['tags']:
-                # Split tags by semicolon and add to our list
-                all_tags.extend(quote['tags'].split('; '))
-        # Convert to set to remove duplicates
-        unique_tags = set(all_tags)
-        print(f"Unique Tags: {len(unique_tags)}")
+        print(f"Unique Tags: {len(self._tags)}")
+        
+        # Show the authors and tags that appear most often
+        print(f"\nTop Authors:")
+        for author, count in self._authors.most_common(5):
+            print(f"  - {author} ({count})")
+        print(f"\nTop Tags:")
+        for tag, count in self._tags.most_common(5):
+            print(f"  - {tag} ({count})")
         
         # Show a few sample quotes
         print(f"\nSample Quotes:")
         # Loop through first 3 quotes (or fewer if we have less than 3)
-        for i, quote in enumerate(self.quotes[:3], 1):
+        for i, (text, author) in enumerate(self._sample, 1):
             # Show first 80 characters of quote text, then add "..."
-            print(f"{i}. \"{quote['text'][:80]}...\" - {quote['author']}")
+            print(f"{i}. \"{text[:80]}...\" - {author}")
         
         print("="*50)
     
+    def close(self):
+        """
+        Save the page cache and close the HTTP session and its open connections
+        
+        Call this when you are done scraping
+        """
+        self._save_etag_cache()
+        self.session.close()
+    
     def run(self, max_pages=5):
         """
         Main method to run the complete scraping process
         
         This method orchestrates the entire workflow:
-        1. Scrape quotes from multiple pages
+        1. Scrape quotes from multiple pages, writing them to a CSV file
+           as each page comes in (so we never hold all quotes in memory)
         2. Display statistics
-        3. Export to CSV
         
         Args:
             max_pages (int): Maximum number of pages to scrape
@@ -285,15 +1012,35 @@ class SimpleQuotesScraper:
         print("🚀 Starting Python Quotes Scraper...")
         print("="*50)
         
-        # Step 1: Scrape quotes from the website
-        self.scrape_all_pages(max_pages)
+        # Step 1: Scrape quotes from the website straight into a CSV file
+        filename = self._default_filename()
+        try:
+            # newline='' prevents extra blank lines in CSV
+            # encoding='utf-8' ensures proper handling of special characters
+            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                self._writer = csv.writer(csvfile)
+                # Write the header row (column names)
+                self._writer.writerow(FIELDNAMES)
+                self.scrape_all_pages_sync(max_pages)
+        except Exception as e:
+            # Handle any errors that occur during file writing
+            print(f"Error exporting to CSV: {e}")
+        finally:
+            self._writer = None
+        
+        if self._total:
+            print(f"Successfully exported {self._total} quotes to {filename}")
+        else:
+            # Don't leave a CSV file with only a header row behind
+            if os.path.exists(filename):
+                os.remove(filename)
+            print("No quotes to export!")
         
         # Step 2: Show statistics about what we collected
         self.display_stats()
         
-        # Step 3: Export the quotes to a CSV file
-        if self.quotes:
-            self.export_to_csv()
+        # Step 3: Close the connections to the website
+        self.close()
         
         print("\n✅ Scraping process completed!")
 
@@ -303,19 +1050,33 @@ def main():
     
     This function:
     1. Creates a scraper instance
-    2. Gets the number of pages from command line arguments
+    2. Gets the number of pages (and options) from command line arguments
     3. Runs the scraper
     """
+    # Options start with "--", everything else is the number of pages
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    
+    # Show progress messages with the time they happened
+    # --quiet only shows warnings and errors (the final report is always shown)
+    logging.basicConfig(
+        level=logging.WARNING if '--quiet' in options else logging.INFO,
+        format='%(asctime)s %(message)s'
+    )
+    # httpx logs every request it makes - our own messages are enough
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    
     # Create a new instance of our scraper class
-    scraper = SimpleQuotesScraper()
+    # --no-cache turns off the local HTTP cache, so every page is downloaded again
+    scraper = SimpleQuotesScraper(use_cache='--no-cache' not in options)
     
     # Get the number of pages to scrape from command line arguments
     # Default to 3 pages if no argument is provided
     max_pages = 3
-    if len(sys.argv) > 1:
+    if args:
         try:
             # Convert the command line argument to an integer
-            max_pages = int(sys.argv[1])
+            max_pages = int(args[0])
         except ValueError:
             # If the argument isn't a valid number, use the default
             print("Invalid page number. Using default: 3 pages")
@@ -6,41 +6,30 @@ Quick test to verify the scraper is working correctly
 
 import sys
 import os
+import importlib.util
 
 # Add current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def test_imports():
-    """Test if all required packages can be imported"""
+    """Test if all required packages are installed"""
     print("🧪 Testing package imports...")
     
-    try:
-        import requests
-        print("✅ requests imported successfully")
-    except ImportError as e:
-        print(f"❌ requests import failed: {e}")
-        return False
-    
-    try:
-        from bs4 import BeautifulSoup
-        print("✅ beautifulsoup4 imported successfully")
-    except ImportError as e:
-        print(f"❌ beautifulsoup4 import failed: {e}")
-        return False
-    
-    try:
-        import csv
-        print("✅ csv imported successfully")
-    except ImportError as e:
-        print(f"❌ csv import failed: {e}")
-        return False
+    # find_spec only looks the package up without running its code,
+    # so this check is instant even for big packages like requests
+    # (csv and datetime are part of Python itself, so they are not checked)
+    packages = [
+        ('requests', 'requests'),
+        ('bs4', 'beautifulsoup4'),
+        ('aiohttp', 'aiohttp'),
+        ('httpx', 'httpx'),
+    ]
     
-    try:
-        from datetime import datetime
-        print("✅ datetime imported successfully")
-    except ImportError as e:
-        print(f"❌ datetime import failed: {e}")
-        return False
+    for module_name, package_name in packages:
+        if importlib.util.find_spec(module_name) is None:
+            print(f"❌ {package_name} is not installed")
+            return False
+        print(f"✅ {package_name} available")
     
     return True
 
@@ -83,6 +72,120 @@ def test_flask_app():
         print(f"❌ Flask app test failed: {e}")
         return False
 
+# A small page in the same layout as quotes.toscrape.com, used for offline tests
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>Quotes to Scrape</title></head>
+<body>
+    <div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
+        <span class="text" itemprop="text">“It&#39;s our choices, Harry &amp; co.”</span>
+        <span>by <small class="author" itemprop="author">J.K. Rowling</small>
+        <a href="/author/J-K-Rowling">(about)</a>
+        </span>
+        <div class="tags">
+            Tags:
+            <meta class="keywords" itemprop="keywords" content="abilities,choices" / >
+            <a class="tag" href="/tag/abilities/page/1/">abilities</a>
+            <a class="tag" href="/tag/choices/page/1/">choices</a>
+        </div>
+    </div>
+    <div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
+        <span class="text" itemprop="text">“A quote without tags.”</span>
+        <span>by <small class="author" itemprop="author">Anonymous</small>
+        </span>
+        <div class="tags">
+            Tags:
+        </div>
+    </div>
+</body>
+</html>
+""".encode('utf-8')
+
+# A page where the first quote has no tags <div> at all
+SAMPLE_PAGE_NO_TAGS_DIV = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"></head>
+<body>
+    <div class="quote">
+        <span class="text">A</span>
+        <span>by <small class="author">Author A</small></span>
+    </div>
+    <div class="quote">
+        <span class="text">B</span>
+        <span>by <small class="author">Author B</small></span>
+        <div class="tags">
+            <a class="tag" href="/tag/tb/page/1/">tb</a>
+        </div>
+    </div>
+</body>
+</html>
+""".encode('utf-8')
+
+def test_quote_parsing():
+    """Test that the fast regex parser and the lxml parser extract the same quotes"""
+    print("\n🧪 Testing quote parsing (offline)...")
+    
+    import flask_app
+    
+    # The fast path: regular expressions over the raw bytes
+    regex_quotes = flask_app._regex_quotes(SAMPLE_PAGE, 1, 1)
+    # The fallback path: a real HTML parser
+    tree = flask_app.lxml_html.fromstring(SAMPLE_PAGE)
+    lxml_quotes = flask_app._collect_quotes(flask_app.XP_QUOTES(tree), 1, 1)
+    
+    # Timestamps differ by a few microseconds, so compare everything else
+    def without_timestamp(quotes):
+        return [{k: v for k, v in quote.items() if k != 'timestamp'} for quote in quotes]
+    
+    assert without_timestamp(regex_quotes) == without_timestamp(lxml_quotes), \
+        "Regex and lxml parsers disagree"
+    
+    first = regex_quotes[0]
+    assert first['text'] == "“It's our choices, Harry & co.”", f"Unexpected quote data: {first}"
+    assert first['tags'] == ['abilities', 'choices'], f"Unexpected quote data: {first}"
+    assert regex_quotes[1]['tags'] == [], f"Unexpected quote data: {regex_quotes[1]}"
+    
+    # A quote without a tags <div> must not take the next quote's tags:
+    # the regex gives up and the HTML parser handles the page
+    assert flask_app._regex_quotes(SAMPLE_PAGE_NO_TAGS_DIV, 1, 1) is None, \
+        "Regex parser did not fall back on an unexpected layout"
+    quotes = flask_app._parse_quotes(SAMPLE_PAGE_NO_TAGS_DIV, 1)
+    assert [(quote['text'], quote['tags']) for quote in quotes] == [('A', []), ('B', ['tb'])], \
+        f"Unexpected quotes: {quotes}"
+    
+    print(f"✅ Both parsers found the same {len(regex_quotes)} quotes")
+    return True
+
+def test_not_modified_page():
+    """Test that a page answered with "304 Not Modified" reuses its cached quotes correctly"""
+    print("\n🧪 Testing unchanged page reuse (offline)...")
+    
+    import tempfile
+    from simple_scraper import SimpleQuotesScraper, _parse_html
+    
+    scraper = SimpleQuotesScraper(use_cache=False)
+    url = scraper._page_url(2)
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Pretend page 2 was parsed in an earlier run, long ago
+        scraper.etag_cache_dir = cache_dir
+        scraper._etag_cache = {}
+        scraper._remember_page(url, '"v1"', _parse_html(SAMPLE_PAGE, 2, 11, '2020-01-01T00:00:00'))
+        
+        # 12 quotes are already collected, and the website says page 2 hasn't changed
+        scraper._cols['id'] = list(range(1, 13))
+        not_modified = type('Response', (), {'status_code': 304, 'headers': {}})()
+        scraper._get = lambda url: not_modified
+        quotes = scraper.scrape_page(2)
+    
+    assert quotes['id'] == [13, 14], f"Unexpected IDs: {quotes['id']}"
+    assert quotes['text'][0] == "“It's our choices, Harry & co.”", f"Unexpected quotes: {quotes}"
+    assert all(not stamp.startswith('2020') for stamp in quotes['timestamp']), \
+        f"Old timestamps were reused: {quotes['timestamp']}"
+    
+    print("✅ Cached quotes were renumbered and given the current time")
+    return True
+
 def test_web_scraping():
     """Test actual web scraping (minimal test)"""
     print("\n🧪 Testing web scraping capability...")
@@ -130,6 +233,8 @@ def main():
         ("Package Imports", test_imports),
         ("Simple Scraper Class", test_simple_scraper),
         ("Flask App Class", test_flask_app),
+        ("Quote Parsing", test_quote_parsing),
+        ("Unchanged Page Reuse", test_not_modified_page),
         ("Web Scraping Capability", test_web_scraping)
     ]
     
@@ -138,7 +243,13 @@ def main():
     
     for test_name, test_func in tests:
         print(f"\n📋 Running: {test_name}")
-        if test_func():
+        try:
+            ok = test_func()
+        except AssertionError as e:
+            # Tests that check with assert report the problem here
+            print(f"❌ {e}")
+            ok = False
+        if ok:
             passed += 1
             print(f"✅ {test_name} PASSED")
         else:
@@ -151,7 +262,7 @@ def main():
         print("🎉 All tests passed! Your Python scraper is ready to use.")
         print("\n🚀 Next steps:")
         print("1. Run: python simple_scraper.py")
-        print("2. Or run: python flask_app.py")
+        print("2. Or run: FLASK_DEV=1 python flask_app.py")
     else:
         print("⚠️  Some tests failed. Check the output above for details.")
         print("\n🔧 Troubleshooting:")